@@ -2,9 +2,11 @@
 from .custom_logging import *
 from .type_aliases import *
 from .dataclass_containers import *
+from .rate_limiters import *
 
 __all__ = [
     "custom_logging",
     "type_aliases",
-    "dataclass_containers.py"
+    "dataclass_containers.py",
+    "rate_limiters",
 ]
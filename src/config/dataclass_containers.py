@@ -55,6 +55,12 @@ class _CoreProperties:
     _dims: tuple = field(init=False, default=('x', 'y', 'z'), repr=False)
     _units: tuple = field(init=False, default=('m', 'm', 'm'), repr=False)
 
+    # Snapshot of ``regions`` keys; cleared by the private region mutators whenever a key changes
+    _region_names: tuple | None = field(init=False, default=None, repr=False)
+
+    # Bumped by every private mutator below; see ``version``
+    _version: int = field(init=False, default=0, repr=False)
+
     def __post_init__(self, initial_system: mm.System):
         """
         If the user loaded initial meshes/regions, feed them through our
@@ -107,6 +113,24 @@ class _CoreProperties:
         """The region underlying the main mesh in which all other regions much be positioned."""
         return self._main_region
 
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter increased whenever meshes, regions or the system change.
+
+        Consumers can store the value alongside anything derived from these properties, and
+        treat it as stale once the counter has moved on.
+        """
+        return self._version
+
+    @property
+    def region_names(self) -> tuple[str, ...]:
+        """Names of all stored regions; cached until a region is next added or removed."""
+        if self._region_names is None:
+            self._region_names = tuple(self.regions)
+
+        return self._region_names
+
     @property
     def cell(self):
         """The cell‐size of the main mesh."""
@@ -148,6 +172,7 @@ class _CoreProperties:
         """
         # Error handling in ``self._add_mesh`` ensures valid typings
         self.meshes[self._domain_key] = mesh
+        self._version += 1
 
         # Make mesh's region our main region, and update all derived states
         self._main_region = mesh.region
@@ -179,11 +204,13 @@ class _CoreProperties:
         if not isinstance(mesh, df.Mesh):
             logger.error("Attempted to add non-Mesh %r under name %r", mesh, name, stack_info=True)
         self.meshes[name] = mesh
+        self._version += 1
 
     def _remove_mesh(self, name: str):
         """Drop a mesh from ``meshes``."""
         if name in self.meshes.keys():
             self.meshes.pop(name, None)
+            self._version += 1
         else:
             logger.debug("Requested mesh %r for removal not in meshes %r", name, self.meshes, stack_info=True)
 
@@ -198,11 +225,16 @@ class _CoreProperties:
         if not isinstance(region, df.Region):
             logger.error("Attempted to add non-Region %r under name %r", region, name, stack_info=True)
 
+        if name not in self.regions:
+            self._region_names = None
         self.regions[name] = region
+        self._version += 1
 
     def _remove_region(self, name: str):
         if name in self.regions.keys():
             self.regions.pop(name, None)
+            self._region_names = None
+            self._version += 1
         else:
             logger.debug("Requested region %r for removal not in regions %r", name, self.regions, stack_info=True)
 
@@ -223,6 +255,8 @@ class _CoreProperties:
             self._main_mesh = mesh
             self._main_region = mesh.region
             self.regions["main"] = mesh.region
+            self._region_names = None
+            self._version += 1
 
         if self._system.energy:
             pass
@@ -235,4 +269,5 @@ class _CoreProperties:
             raise RuntimeError("No System has been loaded yet")
 
         self._system.m = m0
+        self._version += 1
         logger.debug("CoreProperties: set initial magnetisation → %r", m0)
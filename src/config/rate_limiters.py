@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Project: UbermagGUI
+Path:    src/config/rate_limiters.py
+
+Description:
+    Helpers that limit how often widget callbacks run, following the ``Timer``/``debounce``
+    pattern from the ipywidgets "Widget Events" documentation.
+
+Author:      Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+Created:     16 Oct 2026
+IDE:         PyCharm
+Version:     0.1.0
+"""
+
+# Standard library imports
+import asyncio
+import functools
+import logging
+from typing import Any, Callable, Optional
+
+# Third-party imports
+
+# Local application imports
+
+__all__ = ["SELECT_DEBOUNCE_S", "Timer", "debounce", "throttle"]
+
+logger = logging.getLogger(__name__)
+
+# Seconds a selector must stay on one option before its content is swapped in
+SELECT_DEBOUNCE_S = 0.15
+
+
+class Timer:
+    """
+    Run ``callback`` once, ``timeout`` seconds after ``start``, unless cancelled first.
+
+    Scheduled straight onto the running loop with ``call_later`` (as matplotlib's ``draw_idle``
+    does), so no coroutine or task is created for each restart of the timer.
+    """
+
+    def __init__(self, timeout: float, callback: Callable[[], Any]):
+        self._timeout = timeout
+        self._callback = callback
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def _run(self) -> None:
+        self._handle = None
+        try:
+            self._callback()
+        except Exception:
+            # Only the loop's default handler would see this; log with our own context instead
+            logger.exception("Timer._run: delayed callback %r failed", self._callback)
+
+    def start(self) -> None:
+        self._handle = asyncio.get_running_loop().call_later(self._timeout, self._run)
+
+    def cancel(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+
+def debounce(wait: float):
+    """
+    Decorator that postpones calls to the wrapped function until ``wait`` seconds have passed
+    since its most recent call; only the latest arguments are used.
+
+    Relies on the asyncio loop the IPython kernel runs widget callbacks in. When no loop is
+    running (e.g. a plain script), calls go straight through. The returned function has a
+    ``cancel()`` attribute to drop any pending call.
+    """
+    def decorator(fn: Callable) -> Callable:
+        timer: Optional[Timer] = None
+
+        def cancel() -> None:
+            nonlocal timer
+            if timer is not None:
+                timer.cancel()
+                timer = None
+
+        @functools.wraps(fn)
+        def debounced(*args, **kwargs) -> None:
+            nonlocal timer
+            cancel()
+
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                fn(*args, **kwargs)
+                return
+
+            timer = Timer(wait, lambda: fn(*args, **kwargs))
+            timer.start()
+
+        debounced.cancel = cancel
+        return debounced
+
+    return decorator
+
+
+def throttle(wait: float):
+    """
+    Decorator that runs the wrapped function at most once every ``wait`` seconds.
+
+    The first call runs immediately. Calls arriving within the following ``wait`` seconds are
+    collapsed, and the most recent of them runs when that window closes, so the final state is
+    never dropped. As with ``debounce``, calls go straight through when no asyncio loop is
+    running, and ``cancel()`` drops any pending trailing call.
+    """
+    def decorator(fn: Callable) -> Callable:
+        timer: Optional[Timer] = None
+        # Latest (args, kwargs) received while the window was open
+        pending: Optional[tuple] = None
+
+        def cancel() -> None:
+            nonlocal timer, pending
+            pending = None
+            if timer is not None:
+                timer.cancel()
+                timer = None
+
+        def open_window() -> None:
+            nonlocal timer
+            timer = Timer(wait, close_window)
+            timer.start()
+
+        def close_window() -> None:
+            nonlocal timer, pending
+            timer = None
+            if pending is not None:
+                args, kwargs = pending
+                pending = None
+                fn(*args, **kwargs)
+                # The trailing call starts a fresh window of its own
+                open_window()
+
+        @functools.wraps(fn)
+        def throttled(*args, **kwargs) -> None:
+            nonlocal pending
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                fn(*args, **kwargs)
+                return
+
+            if timer is None:
+                fn(*args, **kwargs)
+                open_window()
+            else:
+                pending = (args, kwargs)
+
+        throttled.cancel = cancel
+        return throttled
+
+    return decorator
@@ -16,7 +16,6 @@ Version:     0.1.0
 # Standard library imports
 import logging
 import ipywidgets as widgets
-from IPython.display import display
 
 # Third-party imports
 import discretisedfield as df
@@ -117,7 +116,8 @@ class ViewportsController:
         )
         self.selector.observe(self._on_select, names='value')
 
-        self.content = widgets.Output(
+        # Children are swapped atomically; avoids the clear-then-display flicker of an Output
+        self.content = widgets.Box(
             layout=widgets.Layout(width='100%', height='100%', overflow='auto')
         )
 
@@ -125,22 +125,18 @@ class ViewportsController:
         if change.get('name') == 'value':
             name = change['new']
             logger.debug("ViewportsController._on_select: switching to feature %r", name)
-            self.content.clear_output()
-            with self.content:
-                display(self.features[name].build())
+            self.content.children = (self.features[name].build(),)
 
-    def build(self) -> widgets.Output:
+    def build(self) -> widgets.Box:
         """
-         Return the content Output widget, populated with the first feature immediately.
+         Return the content Box widget, populated with the first feature immediately.
         """
         first = list(self.features)[0]
-        self.content.clear_output()
         self.selector.value = first
 
         # Immediately rendering, instead of waiting on _on_select guards race conditions
         logger.debug("ViewportsController.build: rendering initial feature %r", first)
-        with self.content:
-            display(self.features[first].build())
+        self.content.children = (self.features[first].build(),)
 
         return self.content
 
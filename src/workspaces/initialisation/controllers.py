@@ -27,7 +27,6 @@ from __future__ import annotations
 
 # Standard library imports
 import ipywidgets as widgets
-from IPython.display import display
 import logging
 from typing import Any, Optional
 
@@ -35,10 +34,54 @@ from typing import Any, Optional
 import discretisedfield as df
 
 # Local application imports
+from src.config.rate_limiters import SELECT_DEBOUNCE_S, debounce
 from . import domain, regions, fields, meshes
 
 logger = logging.getLogger(__name__)
 
+# Guaranteeing widths will be particularly helpful when displaying icons
+_TOGGLE_WIDTH = '10ch'
+
+# Shared by every feature's selector; only the panel names differ between features
+_TOGGLE_STYLE = {
+    'button_width': _TOGGLE_WIDTH,
+    'align_content': 'center',
+    'justify_content': 'center'
+}
+
+# Layouts are widgets in their own right; these never vary, so every feature shares one model each
+_LAYOUT_SELECTOR = widgets.Layout(
+    display='flex',  # required for column-nowrap to take effect
+    flex='0 0 auto',  # keep own width; the panel area takes the rest of the row
+    flex_flow='column nowrap',
+    min_width=_TOGGLE_WIDTH,
+    width=_TOGGLE_WIDTH,
+    overflow='hidden',
+)
+_LAYOUT_PANEL_AREA = widgets.Layout(
+    display='flex',
+    flex='1 1 auto',
+    flex_flow='column nowrap',
+    width='100%', min_width='0',
+    min_height='0',
+    overflow_x="hidden",
+    overflow_y="auto"
+)
+_LAYOUT_FEATURE_ROW = widgets.Layout(
+    display='flex',
+    width='100%',
+    min_height='0',
+    gap='4px',
+    overflow='hidden',
+)
+_LAYOUT_TAB = widgets.Layout(
+    display='flex',
+    flex='1 1 0',
+    width='100%',
+    height='100%',
+    overflow='hidden'
+)
+
 
 __all__ = [
     "HandleFeature",
@@ -58,6 +101,12 @@ class HandleFeature:
 
     Each feature is designed to be held by a parent container.
     """
+    __slots__ = (
+        "_props", "_panels", "_refreshable", "_refresh_in_place", "_selector", "_panel_area", "_feature_row",
+        "_panel_cache", "_active_panel_name", "_pending_panel", "_views_reported",
+        "_debounced_render",
+    )
+
     def __init__(
             self,
             properties_controller: Any  # TODO. Get futures working for type hinting
@@ -77,7 +126,28 @@ class HandleFeature:
         self._selector: Optional[widgets.ToggleButtons] = None
         self._panel_area: Optional[widgets.Box] = None
 
-    def build_feature(self, panel_map: dict) -> widgets.GridspecLayout:
+        # The [ selector | content ] container; created on first build and then reused
+        self._feature_row: Optional[widgets.HBox] = None
+
+        # Names of the panels that expose a refresh(); filled in alongside self._panels
+        self._refreshable: frozenset[str] = frozenset()
+        # Subset whose refresh() covers everything their build() derives from the properties
+        self._refresh_in_place: frozenset[str] = frozenset()
+
+        # Built panels, keyed by name, with the properties' version they were built against
+        self._panel_cache: dict[str, tuple[int, widgets.Widget]] = {}
+        # Panel currently shown in the panel area; the others stay mounted but hidden
+        self._active_panel_name: Optional[str] = None
+
+        # Panel requested while the panel area had no frontend views; rendered once one appears
+        self._pending_panel: Optional[str] = None
+        # Set once the frontend has reported a view, proving it supports `_view_count` tracking
+        self._views_reported = False
+
+        # Rapid clicks/arrow-keys through the selector only render the panel they settle on
+        self._debounced_render = debounce(SELECT_DEBOUNCE_S)(self._render_panel)
+
+    def build_feature(self, panel_map: dict) -> widgets.HBox:
         """
         Build a two-column layout for the feature: [ selector | content ]
 
@@ -88,31 +158,27 @@ class HandleFeature:
         """
         # Stash for children
         self._panels = panel_map
-
-        # Create from properties
-        selector = self.selector
-        content = self.panel_area
-
-        # Build feature
-        feature_grid = widgets.GridspecLayout(
-            n_rows=1, n_columns=2,
-            layout=widgets.Layout(
-                display='flex',
-                min_height='0',
-                gap='4px',
-                overflow='hidden',
-            )
+        self._refreshable = frozenset(
+            name for name, panel in panel_map.items() if callable(getattr(panel, 'refresh', None))
+        )
+        self._refresh_in_place = frozenset(
+            name for name in self._refreshable
+            if getattr(panel_map[name], '_refresh_covers_build', False)
         )
 
-        # 1st column follows own Layout, and 2nd column fills remaining space
-        feature_grid._grid_template_columns = f'{selector.style.button_width} 1fr'
-
-        feature_grid[0, 0] = selector
-        feature_grid[0, 1] = content
+        if self._feature_row is None:
+            # only create once; later builds re-render the active panel into the same row.
+            # Selector keeps its own width, and the panel area's flex fills the remaining space
+            self._feature_row = widgets.HBox(
+                children=(self.selector, self.panel_area),
+                layout=_LAYOUT_FEATURE_ROW
+            )
 
-        self._render_panel(selector.value)
+        # Render now; drop any render still pending from earlier selector clicks
+        self._debounced_render.cancel()
+        self._render_panel(self.selector.value)
 
-        return feature_grid
+        return self._feature_row
 
     @property
     def selector(self) -> widgets.ToggleButtons:
@@ -121,33 +187,20 @@ class HandleFeature:
         wiring required by `workspace_controller.py` and other higher-level controllers.
         """
         if self._selector is None:
-            names = list(self._panels.keys())
-
-            # Guaranteeing widths will be particularly helpful when displaying icons
-            min_width = '10ch' #str(min(max(len(n) for n in names), 8) + 2) + "ch"
+            names = tuple(self._panels)
 
             self._selector = widgets.ToggleButtons(
                 options=names,
-                tooltips=tuple(names),
+                value=names[0] if names else None,
+                tooltips=names,
                 button_style='',  # greyed out
-                style={
-                    'button_width': min_width,
-                    'align_content': 'center',
-                    'justify_content': 'center'
-                },
-                layout=widgets.Layout(
-                    display='flex',  # required for column-nowrap to take effect
-                    flex_flow='column nowrap',
-                    min_width=min_width, width=min_width,
-                    overflow='hidden',
-                ),
+                style=_TOGGLE_STYLE,
+                layout=_LAYOUT_SELECTOR,
             )
 
+            # Observe only once the initial value is in place; build_feature renders that one
             self._selector.observe(self._on_select, names='value')
 
-            if names:
-                self._selector.value = names[0]
-
         return self._selector
 
     @property
@@ -158,42 +211,97 @@ class HandleFeature:
         Lazily constructed when first accessed.
         """
         if self._panel_area is None:
-            self._panel_area: widgets.Box = widgets.Box(
-                layout=widgets.Layout(
-                    display='flex',
-                    flex='1 1 auto',
-                    flex_flow='column nowrap',
-                    width='100%', min_width='0',
-                    min_height='0',
-                    overflow_x="hidden",
-                    overflow_y="auto"
-                )
-            )
+            self._panel_area: widgets.Box = widgets.Box(layout=_LAYOUT_PANEL_AREA)
+
+            # Opt in to frontend view counting, so renders can wait while nothing displays us
+            self._panel_area._view_count = 0
+            self._panel_area.observe(self._on_view_count, names='_view_count')
+
         return self._panel_area
 
+    def _on_view_count(self, change: dict) -> None:
+        """Run any render deferred while the panel area was not displayed."""
+        if not change['new']:
+            return
+
+        self._views_reported = True
+        if self._pending_panel is not None:
+            panel_name, self._pending_panel = self._pending_panel, None
+            self._render_panel(panel_name)
+
     def _on_select(self, change: dict) -> None:
         """Handles when ToggleButtons' value changes."""
-        if change.get('name') == 'value':
-            self._render_panel(change['new'])
+        if change.get('name') == 'value' and change['new'] != change['old']:
+            self._debounced_render(change['new'])
+
+    @staticmethod
+    def _refresh_panel(feature: Any) -> None:
+        """Internal helper to run ``feature.refresh()``, logging rather than raising on failure."""
+        try:
+            feature.refresh()
+        except Exception:
+            logger.exception(f"HandleFeature._render_panel: {feature!r}.refresh() failed")
 
     def _render_panel(self, panel_name: str) -> None:
-        """Clear the active box, and display the chosen panel."""
-        feature = self._panels.get(panel_name)
-        panel_requested = feature.build(self._props)
+        """
+        Hide the active panel, and display the chosen one.
+
+        Each panel is mounted into the panel area the first time it is shown and then stays
+        there; switching panels only flips ``layout.display``, so the frontend keeps their views
+        (and any user input) instead of re-creating them. When the shared properties have changed
+        since a panel's last build, panels whose ``refresh()`` covers their whole build (see
+        ``_PanelBase._refresh_covers_build``) update their existing widgets in place; all others
+        are rebuilt. While the panel area is not displayed anywhere, the render is deferred until
+        a view of it appears.
+        """
+        if self._views_reported and not self._panel_area._view_count:
+            self._pending_panel = panel_name
+            return
+        self._pending_panel = None
 
-        if panel_requested is None:
+        panels = self._panels
+        feature = panels.get(panel_name)
+        if feature is None:
+            # e.g. the selector was cleared, or the name belongs to a since-replaced panel map
             return
 
-        if hasattr(feature, "refresh"):
-            try:
-                feature.refresh()
-            except Exception:
-                logger.exception(f"HandleFeature._render_panel: {feature!r}.refresh() failed")
+        version = self._props.version
+        cached = self._panel_cache.get(panel_name)
+
+        if cached is not None and (cached[0] == version or panel_name in self._refresh_in_place):
+            panel_requested = cached[1]
+            if cached[0] != version:
+                # Stale, but refresh() covers the build: update in place so half-entered inputs survive
+                self._refresh_panel(feature)
+                self._panel_cache[panel_name] = (version, panel_requested)
+        else:
+            panel_requested = feature.build(self._props)
+
+            if panel_requested is None:
+                return
+
+            if panel_name in self._refreshable:
+                self._refresh_panel(feature)
+
+            self._panel_cache[panel_name] = (version, panel_requested)
+
+        previous = self._panel_cache.get(self._active_panel_name)
+        if previous is not None and previous[1] is not panel_requested:
+            previous[1].layout.display = 'none'
+
+        if panel_requested.layout.display != 'flex':
+            panel_requested.layout.display = 'flex'
+
+        area = self._panel_area
+        if panel_requested not in area.children:
+            area.children += (panel_requested,)
 
-        self._panel_area.children = (panel_requested,)
+        self._active_panel_name = panel_name
 
 
 class GeometryController(HandleFeature):
+    __slots__ = ("panels",)
+
     def __init__(
             self,
             properties_controller,
@@ -221,12 +329,17 @@ class GeometryController(HandleFeature):
         workspace_controller.register_geometry_listener(
             lambda main, subs: self.panels['Remove'].refresh()
         )
+        workspace_controller.register_geometry_listener(
+            lambda main, subs: self.panels['Place'].refresh()
+        )
 
-    def build(self) -> widgets.GridspecLayout:
+    def build(self) -> widgets.HBox:
         return self.build_feature(self.panels)
 
 
 class SystemInitController(HandleFeature):
+    __slots__ = ("panels",)
+
     def __init__(
             self,
             properties_controller,
@@ -266,7 +379,7 @@ class SystemInitController(HandleFeature):
             lambda mesh: self.panels['Mesh'].refresh()
         )
 
-    def build(self) -> widgets.GridspecLayout:
+    def build(self) -> widgets.HBox:
         return self.build_feature(self.panels)
 
 
@@ -274,6 +387,8 @@ class InitialisationController:
     """
     Exposes Geometry + System‐Init features under one Tab widget.
     """
+    __slots__ = ("geometry", "system_init", "_unbuilt_tabs")
+
     def __init__(
             self,
             # access to top-level shared attributes
@@ -302,24 +417,47 @@ class InitialisationController:
             init_mag_callback=init_mag_callback,
         )
 
+        # Features whose tab still holds a placeholder, keyed by tab index
+        self._unbuilt_tabs: dict[int, HandleFeature] = {}
+
     def build(self) -> widgets.Tab:
         """
         Called by WorkplaceController.render().
 
-        Returns our wired tab.
+        Returns our wired tab. Only the first tab is built here; the others are built the first
+        time they are selected.
         """
+        # (title, feature) in tab order; a single pass builds the first and stubs the rest
+        features = (("Geometry", self.geometry), ("System Init.", self.system_init))
+
+        titles, children = [], []
+        self._unbuilt_tabs = {}
+        for idx, (title, feature) in enumerate(features):
+            titles.append(title)
+            if idx == 0:
+                children.append(feature.build())
+            else:
+                children.append(widgets.Box())
+                self._unbuilt_tabs[idx] = feature
+
+        # Titles go in with the children, rather than one set_title() sync per tab
         tab = widgets.Tab(
-            children=[self.geometry.build(), self.system_init.build()],
-            layout=widgets.Layout(
-                display='flex',
-                flex='1 1 0',
-                width='100%',
-                height='100%',
-                overflow='hidden'
-            )
+            children=children,
+            titles=titles,
+            layout=_LAYOUT_TAB
         )
 
-        tab.set_title(0, "Geometry")
-        tab.set_title(1, "System Init.")
+        tab.observe(self._on_tab_select, names='selected_index')
 
         return tab
+
+    def _on_tab_select(self, change: dict) -> None:
+        """Swap a tab's placeholder for its built feature the first time the tab is opened."""
+        feature = self._unbuilt_tabs.pop(change['new'], None)
+        if feature is None:
+            return
+
+        tab = change['owner']
+        children = list(tab.children)
+        children[change['new']] = feature.build()
+        tab.children = tuple(children)
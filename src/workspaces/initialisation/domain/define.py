@@ -175,17 +175,21 @@ class DefineDomainRegion(_PanelBase):
 
         Convert UI inputs to S.I., build ``discretisedfield.Region``, and call controller callback.
         """
+        pmin = self.pmin.values
+        pmax = self.pmax.values
+        cell = self.cell.values
+
         logger.debug("DefineDomainRegion._on_define called; pmin=%r, pmax=%r, units=%r",
-                     self.pmin.values, self.pmax.values, self.units_dd.value)
+                     pmin, pmax, self.units_dd.value)
 
         # unit → SI factor
         self._sys_props._units = (self.units_dd.value, self.units_dd.value, self.units_dd.value)
         user_si_prefix = UNIT_FACTORS[self._sys_props._units[0]]
 
         # convert to SI
-        p1 = tuple(v * user_si_prefix for v in self.pmin.values)
-        p2 = tuple(v * user_si_prefix for v in self.pmax.values)
-        cell = tuple(v * user_si_prefix for v in self.cell.values)
+        p1 = (pmin[0] * user_si_prefix, pmin[1] * user_si_prefix, pmin[2] * user_si_prefix)
+        p2 = (pmax[0] * user_si_prefix, pmax[1] * user_si_prefix, pmax[2] * user_si_prefix)
+        cell = (cell[0] * user_si_prefix, cell[1] * user_si_prefix, cell[2] * user_si_prefix)
         self._sys_props._cell = cell
 
         try:
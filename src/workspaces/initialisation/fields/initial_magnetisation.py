@@ -59,6 +59,8 @@ class DefineSystemInitialMagnetisation(_PanelBase):
     chk_mask: widgets.Checkbox
     btn_define: widgets.Button
 
+    _refresh_covers_build = True
+
     def __init__(self):
         super().__init__()
 
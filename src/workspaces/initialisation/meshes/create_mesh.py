@@ -55,6 +55,8 @@ class CreateMesh(_PanelBase):
     ckk_bc_z: widgets.Checkbox
     btn_build_mesh: widgets.Button
 
+    _refresh_covers_build = True
+
     def __init__(self):
         super().__init__()
 
@@ -235,7 +237,11 @@ class CreateMesh(_PanelBase):
 
         Called whenever regions are added/removed upstream.
         """
-        regions_list = list(self._sys_props.regions.keys())
+        if self._sys_props is None:
+            # Not built yet (its tab is built lazily); `_render_panel` refreshes it after building
+            return
+
+        regions_list = self._sys_props.region_names
         logger.debug("CreateMesh.refresh: computed bases=%r", regions_list)
 
         self.dd_base_region.options = regions_list
@@ -53,6 +53,8 @@ class SelectSubregionsInMesh(_PanelBase):
     chk_mask: widgets.Checkbox
     btn_define: widgets.Button
 
+    _refresh_covers_build = True
+
     def __init__(self):
         # callback(mesh_field: df.Field) → builder.system.m = mesh_field
         super().__init__()
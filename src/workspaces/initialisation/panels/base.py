@@ -16,7 +16,7 @@ Version:     0.1.0
 # Standard library imports
 from abc import ABC, abstractmethod
 import ipywidgets as widgets
-from typing import Any, Callable, List, Optional, Sequence
+from typing import Any, Callable, ClassVar, List, Optional, Sequence
 
 # Third-party imports
 
@@ -24,6 +24,12 @@ from typing import Any, Callable, List, Optional, Sequence
 
 __all__ = ["_PanelBase"]
 
+# Layouts common to many panels. Each Layout is a widget model in its own right, so these are
+# created once here and shared by every panel that imports them
+_LAYOUT_AUTO = widgets.Layout(width="auto")
+_LAYOUT_LABELLED_ROW = widgets.Layout(align_items="center", justify_content="flex-end", gap="4px")
+_LAYOUT_BUTTON_ROW = widgets.Layout(justify_content="center", width="100%")
+
 
 class _PanelBase(ABC):
     """
@@ -36,6 +42,11 @@ class _PanelBase(ABC):
       - call out to `_compose` to fill its children
       - wire any default button callbacks
     """
+    __slots__ = ("_ctrl_cb", "_sys_props", "_layout", "_panel_box")
+
+    # True only when `refresh()` updates everything `build()` derives from `sys_props`; the
+    # feature controller then refreshes a stale panel in place instead of rebuilding it
+    _refresh_covers_build: ClassVar[bool] = False
 
     def __init__(self):
         # callback into the controller. Used to be called `state_cb` and `mesh_cb`
@@ -21,6 +21,7 @@ import ipywidgets as widgets
 # Third-party imports
 
 # Local application imports
+from .base import _LAYOUT_LABELLED_ROW
 
 __all__ = [
     "ThreeCoordinateInputs"
@@ -28,6 +29,26 @@ __all__ = [
 
 _NumericProtocol = Union[widgets.FloatText, widgets.Text]
 
+# module-level constants. Every coordinate row in every panel shares these Layout instances
+_LAYOUT_TEXTBOX = widgets.Layout(
+    flex='0 0 auto',
+    width="3em",  # Internal default to ensure immutable consistency across all panels
+)
+_LAYOUT_LABEL = widgets.Layout(flex="0 0 auto")
+
+
+def _read_value(widget: Optional[_NumericProtocol]) -> Optional[float]:
+    """Internal helper to read ``widget.value`` once, returning ``None`` if missing or empty."""
+    if widget is None:
+        return None
+
+    value = widget.value
+    if value is None or value == "":
+        # TODO. Insert proper debugging
+        return None
+
+    return float(value)
+
 
 @dataclass
 class ThreeCoordinateInputs:
@@ -59,14 +80,7 @@ class ThreeCoordinateInputs:
 
         Permit `None` entries in the tuple to allow for error checking within `controllers`.
         """
-        values: list[Optional[float]] = []
-        for v in (self.x, self.y, self.z):
-            if v is None or v.value is None or v.value == "":
-                # TODO. Insert proper debugging
-                values.append(None)
-            else:
-                values.append(float(v.value))
-        return tuple(values)
+        return _read_value(self.x), _read_value(self.y), _read_value(self.z)
 
     @values.setter
     def values(self, values: tuple[float, float, float]) -> None:
@@ -90,23 +104,15 @@ class ThreeCoordinateInputs:
             - Cartesian coordinates;
             - cell sizes.
         """
-        textbox_layout = widgets.Layout(
-            flex='0 0 auto',
-            width="3em",  # Internal default to ensure immutable consistency across all panels
-        )
-
-        text_widgets = []
-        for val in defaults:
-            text_widgets.append(widgets.FloatText(value=val, layout=textbox_layout))
+        x = widgets.FloatText(value=defaults[0], layout=_LAYOUT_TEXTBOX)
+        y = widgets.FloatText(value=defaults[1], layout=_LAYOUT_TEXTBOX)
+        z = widgets.FloatText(value=defaults[2], layout=_LAYOUT_TEXTBOX)
 
-        label = widgets.HTMLMath(label_tex, layout=widgets.Layout(flex="0 0 auto"))
+        label = widgets.HTMLMath(label_tex, layout=_LAYOUT_LABEL)
 
-        hbox = widgets.HBox(
-            [label, *text_widgets],
-            layout=widgets.Layout(align_items="center", justify_content="flex-end", gap="4px"),
-        )
+        hbox = widgets.HBox([label, x, y, z], layout=_LAYOUT_LABELLED_ROW)
 
-        inst = cls(*text_widgets)
+        inst = cls(x, y, z)
         inst._hbox = hbox
 
         return inst
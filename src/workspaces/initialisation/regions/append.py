@@ -95,7 +95,7 @@ class AppendRegionUsingBase(_PanelBase):
         )
         
         self.select_base_region = widgets.Dropdown(
-            options=list(self._sys_props.regions.keys()),
+            options=self._sys_props.region_names,
             layout=widgets.Layout(width="40%")
         )
         children.append(
@@ -246,12 +246,12 @@ class AppendRegionUsingBase(_PanelBase):
         if self._ctrl_cb:
             self._ctrl_cb(region_name, new_region)
 
-    def refresh(self, bases: list) -> None:
+    def refresh(self, *_) -> None:
         """
         Called when geometry changes, so we can update our dropdown of base‐regions.
         """
         current = self.select_base_region.value
-        opts = list(self._sys_props.regions.keys())
+        opts = self._sys_props.region_names
         self.select_base_region.options = opts
         if current in opts:
             self.select_base_region.value = current
\ No newline at end of file
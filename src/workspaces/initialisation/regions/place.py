@@ -19,11 +19,30 @@ import discretisedfield as df
 # Local application imports
 from src.config.type_aliases import UNIT_FACTORS
 from src.workspaces.initialisation.panels import _PanelBase, ThreeCoordinateInputs
+from src.workspaces.initialisation.panels.base import (
+    _LAYOUT_AUTO, _LAYOUT_BUTTON_ROW, _LAYOUT_LABELLED_ROW
+)
 
 __all__ = ["PlaceRegion"]
 
 logger = logging.getLogger(__name__)
 
+# module-level constants
+_LAYOUT_NAME_INPUT = Layout(width="40%")
+_LAYOUT_EXPLAINER = Layout(overflow_y="visible", align_content="stretch", justify_content="flex-start")
+_LAYOUT_UNITS = Layout(justify_content="flex-end")
+
+_HTML_TITLE = widgets.HTML("<b>Define region.</b>")
+_HTML_DESCRIPTION = widgets.HTML(
+    value="Define a new region which can be positioned anywhere in the domain.",
+    layout=_LAYOUT_AUTO
+)
+_HTML_NAME_LABEL = widgets.HTML(value="New region")
+_HTML_CORNERS_EXPLAINER = widgets.HTML(
+    value="Define the two diagonally-opposite corners of the region:",
+    layout=_LAYOUT_EXPLAINER
+)
+
 
 class PlaceRegion(_PanelBase):
     """
@@ -48,17 +67,23 @@ class PlaceRegion(_PanelBase):
     pmax: ThreeCoordinateInputs
     btn_place: widgets.Button
 
+    __slots__ = ("new_region", "pmin", "pmax", "btn_place", "_unit_factor", "_units_html")
+    _refresh_covers_build = True
+
     def __init__(self):
         super().__init__()
 
+        # SI factor for the system's units; kept current by `refresh` instead of per-click lookups
+        self._unit_factor = 1.0
+
+        # Long-lived so a change of units only rewrites its value, rather than rebuilding the panel
+        self._units_html = widgets.HTMLMath(layout=_LAYOUT_UNITS)
+
     def _assemble_panel(self, children: list[widgets.Widget]) -> None:
 
-        children.append(widgets.HTML("<b>Define region.</b>"))
+        children.append(_HTML_TITLE)
 
-        children.append(widgets.HTML(
-            value="Define a new region which can be positioned anywhere in the domain.",
-            layout=Layout(width="auto")
-        ))
+        children.append(_HTML_DESCRIPTION)
 
         children.append(self._make_name_row())
 
@@ -67,20 +92,14 @@ class PlaceRegion(_PanelBase):
         children.append(self._make_place_button())
 
     def _make_name_row(self) -> widgets.HBox:
-        label = widgets.HTML(value="New region")
-
         self.new_region = widgets.Text(
             placeholder="name",
-            layout=Layout(width="40%")
+            layout=_LAYOUT_NAME_INPUT
         )
 
         hbox = widgets.HBox(
-            [label, self.new_region],
-            layout=Layout(
-                align_items="center",
-                justify_content="flex-end",
-                gap="4px"
-            )
+            [_HTML_NAME_LABEL, self.new_region],
+            layout=_LAYOUT_LABELLED_ROW
         )
 
         return hbox
@@ -89,14 +108,7 @@ class PlaceRegion(_PanelBase):
 
         out: list[widgets.Widget] = []
 
-        out.append(
-            widgets.HTML(
-                value="Define the two diagonally-opposite corners of the region:",
-                layout=Layout(overflow_y="visible",
-                              align_content="stretch",
-                              justify_content="flex-start")
-            )
-        )
+        out.append(_HTML_CORNERS_EXPLAINER)
 
         self.pmin = ThreeCoordinateInputs.from_defaults(r"\(\mathbf{p}_1\)", (0, 0, 0))
         out.append(self.pmin.hbox)
@@ -104,18 +116,16 @@ class PlaceRegion(_PanelBase):
         self.pmax = ThreeCoordinateInputs.from_defaults(r"\(\mathbf{p}_2\)", (1, 1, 1))
         out.append(self.pmax.hbox)
 
-        out.append(
-            widgets.HTMLMath(value=f"(Units: {self._sys_props.units[0]})",
-                             layout=Layout(justify_content="flex-end")
-                             )
-        )
+        # Sync the units label and SI factor with the system before showing them
+        self.refresh()
+        out.append(self._units_html)
 
         return out
 
     def _make_place_button(self) -> widgets.HBox:
         self.btn_place = widgets.Button(
             description="Place region",
-            layout=Layout(width="auto"),
+            layout=_LAYOUT_AUTO,
             button_style='',  # default to Grey
             style={"button_width": "auto"}
         )
@@ -125,7 +135,7 @@ class PlaceRegion(_PanelBase):
 
         hbox = widgets.HBox(
             [self.btn_place],
-            layout=Layout(justify_content="center", width="100%")
+            layout=_LAYOUT_BUTTON_ROW
         )
 
         return hbox
@@ -139,27 +149,40 @@ class PlaceRegion(_PanelBase):
             logger.error("PlaceRegion._on_place: no name provided")
             return
 
+        pmin = self.pmin.values
+        pmax = self.pmax.values
+
         logger.debug("PlaceRegion._on_place called; name=%r, pmin=%r, pmax=%r",
-                     self.new_region, self.pmin.values, self.pmax.values)
+                     name, pmin, pmax)
 
-        # Convert to SI using controls.units
-        factor = UNIT_FACTORS.get(self._sys_props.units[0], 1.0)
-        pmin_si = tuple(v * factor for v in self.pmin.values)
-        pmax_si = tuple(v * factor for v in self.pmax.values)
+        # Convert to SI using the cached unit factor
+        factor = self._unit_factor
+        pmin_si = (pmin[0] * factor, pmin[1] * factor, pmin[2] * factor)
+        pmax_si = (pmax[0] * factor, pmax[1] * factor, pmax[2] * factor)
 
         # Create the new Region (in SI units, tagged with user units)
+        props = self._sys_props
         region = df.Region(
             p1=pmin_si, p2=pmax_si,
-            dims=self._sys_props.dims,
-            units=self._sys_props.units
+            dims=props.dims,
+            units=props.units
         )
 
         # Hand off to WorkspaceController
-        if self._ctrl_cb:
-            self._ctrl_cb(name, region)
+        ctrl_cb = self._ctrl_cb
+        if ctrl_cb:
+            ctrl_cb(name, region)
 
         logger.success("PlaceRegion: placed region %r %r", name, region)
 
-    def refresh(self, bases: list) -> None:
-        """Empty"""
-        pass
\ No newline at end of file
+    def refresh(self, *_) -> None:
+        """
+        Called by GeometryController when geometry changes, as a new domain may carry new units.
+        Re-resolve the cached SI factor used by ``_on_place``, and update the units label.
+        """
+        if self._sys_props is None:
+            return
+
+        units = self._sys_props.units[0]
+        self._unit_factor = UNIT_FACTORS.get(units, 1.0)
+        self._units_html.value = f"(Units: {units})"
\ No newline at end of file
@@ -21,11 +21,24 @@ from typing import Any
 
 # Local application imports
 from src.workspaces.initialisation.panels import _PanelBase
+from src.workspaces.initialisation.panels.base import (
+    _LAYOUT_AUTO, _LAYOUT_BUTTON_ROW, _LAYOUT_LABELLED_ROW
+)
 
 __all__ = ["RemoveRegion"]
 
 logger = logging.getLogger(__name__)
 
+_LAYOUT_DROPDOWN = widgets.Layout(width="40%")
+
+_HTML_TITLE = widgets.HTML("<b>Remove region.</b>")
+_HTML_DESCRIPTION = widgets.HTML(
+    value="Remove a saved region from the system. This also removes it "
+          "from any instances in which it is a subregion.",
+    layout=_LAYOUT_AUTO
+)
+_HTML_TARGET_LABEL = widgets.HTML(value="Target region", layout=_LAYOUT_AUTO)
+
 
 class RemoveRegion(_PanelBase):
     """
@@ -39,21 +52,24 @@ class RemoveRegion(_PanelBase):
     btn_delete : widgets.Button
         Button to remove the selected region.
     """
+    __slots__ = ("dd_regions", "btn_delete", "_last_error_state")
+    _refresh_covers_build = True
+
     def __init__(self):
         super().__init__()
 
+        # Slots have no class-level default, so `refresh` needs these to exist before `build`
+        self.dd_regions = None
+        self.btn_delete = None
+
+        # Mirrors `btn_delete.button_style` so repeated invalid clicks don't resend the same style
+        self._last_error_state = ""
+
     def _assemble_panel(self, children: list[widgets.Widget]) -> None:
 
-        children.append(
-            widgets.HTML("<b>Remove region.</b>")
-        )
+        children.append(_HTML_TITLE)
 
-        children.append(
-            widgets.HTML(value="Remove a saved region from the system. This also removes it "
-                               "from any instances in which it is a subregion.",
-                         layout=widgets.Layout(width="auto")
-                         )
-        )
+        children.append(_HTML_DESCRIPTION)
 
         children.append(self._make_dropdown_row())
 
@@ -61,20 +77,14 @@ class RemoveRegion(_PanelBase):
 
     def _make_dropdown_row(self) -> widgets.HBox:
 
-        label = widgets.HTML(value="Target region", layout=widgets.Layout(width="auto"))
-
         # Build dropdown from current regions
         self.dd_regions = widgets.Dropdown(
-            options=list(self._sys_props.regions.keys()),
-            layout=widgets.Layout(width="40%")
+            options=self._sys_props.region_names,
+            layout=_LAYOUT_DROPDOWN
         )
         hbox = widgets.HBox(
-            [label, self.dd_regions],
-            layout=widgets.Layout(
-                align_items="center",
-                justify_content="flex-end",
-                gap="4px"
-            )
+            [_HTML_TARGET_LABEL, self.dd_regions],
+            layout=_LAYOUT_LABELLED_ROW
         )
 
         return hbox
@@ -83,15 +93,17 @@ class RemoveRegion(_PanelBase):
         self.btn_delete = widgets.Button(
             description="Delete region",
             style={"button_style": ""},
-            layout=widgets.Layout(width="auto")
+            layout=_LAYOUT_AUTO
         )
+        self._last_error_state = ""
+
         # wire up the click only if callback is already set
         if self._ctrl_cb:
             self.btn_delete.on_click(self._on_delete)
 
         hbox = widgets.HBox(
             [self.btn_delete],
-            layout=widgets.Layout(justify_content="center", width="100%")
+            layout=_LAYOUT_BUTTON_ROW
         )
 
         return hbox
@@ -100,7 +112,9 @@ class RemoveRegion(_PanelBase):
         """When the user clicks delete—invoke callback & refresh dropdown."""
         key = self.dd_regions.value
         if not key:
-            self.btn_delete.button_style = "danger"
+            if self._last_error_state != "danger":
+                self.btn_delete.button_style = "danger"
+                self._last_error_state = "danger"
             logger.error("RemoveRegion._on_delete: no region selected to delete.")
             return
 
@@ -109,7 +123,9 @@ class RemoveRegion(_PanelBase):
             self._ctrl_cb(key)
 
         self.dd_regions.value = None
-        self.btn_delete.button_style = ""
+        if self._last_error_state:
+            self.btn_delete.button_style = ""
+            self._last_error_state = ""
 
         logger.success("RemoveRegion: deleted %r", key)
 
@@ -127,7 +143,7 @@ class RemoveRegion(_PanelBase):
         # repopulate—don’t auto‐pick first if old is gone
         self._refresh_dropdown(
             self.dd_regions,
-            self._sys_props.regions.keys(),
+            self._sys_props.region_names,
             labeler=str,
             default_first=False
         )
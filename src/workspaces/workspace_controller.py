@@ -13,26 +13,68 @@ IDE:         PyCharm
 Version:     0.1.0
 """
 
+from __future__ import annotations
+
 # Standard library imports
+from contextlib import contextmanager
+import inspect
 import logging
+import weakref
 import ipywidgets as widgets
-import typing
+from typing import TYPE_CHECKING
 
 # Third-party imports
-import micromagneticmodel as mm
 import discretisedfield as df
 
 # Local application imports
 from src.workspaces.initialisation.controllers import InitialisationController
 from src.config.dataclass_containers import _CoreProperties
+from src.config.rate_limiters import SELECT_DEBOUNCE_S, debounce, throttle
 # from .outliner import OutlinerWorkspace
 # from .equations.controllers import EnergyController, DynamicsController
 # from .viewport.workspace import ViewportWorkspace
 
+if TYPE_CHECKING:
+    # Annotations are never evaluated at runtime (see the __future__ import above)
+    from typing import Any, Callable, Optional
+
+    # Registry entry: returns the listener, or None once it has been collected
+    _ListenerRef = Callable[[], Optional[Callable]]
+
 __all__ = ["WorkspaceController", "WorkspaceTopMenu"]
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between viewport redraws; the latest geometry is always drawn last
+_PLOT_THROTTLE_S = 0.05
+
+
+def _listener_ref(cb: Callable) -> _ListenerRef:
+    """
+    Wrap ``cb`` for storage in a listener registry; calling the result returns ``cb``, or ``None``
+    once it has been garbage-collected.
+
+    Bound methods are held weakly, so a torn-down subscriber is neither kept alive nor redrawn.
+    Plain functions and lambdas are usually referenced nowhere else, so they are held strongly.
+    """
+    if inspect.ismethod(cb):
+        return weakref.WeakMethod(cb)
+
+    return lambda: cb
+
+
+def _same_region(a: Optional[df.Region], b: Optional[df.Region]) -> bool:
+    """
+    Whether ``a`` and ``b`` describe the same region, so that storing one over the other is a no-op.
+
+    ``df.Region.__eq__`` only compares the bounds (within tolerance); the labels shown in the
+    panels and plots also count here.
+    """
+    if a is None or b is None:
+        return a is b
+
+    return a == b and a.units == b.units and a.dims == b.dims
+
 
 class WorkspaceController:
     """
@@ -46,7 +88,22 @@ class WorkspaceController:
      - register_geometry_listener(cb)  -> cb(main_region, subregions)
      - register_mesh_listener(cb)      -> cb(mesh)
      - register_init_mag_listener(cb)  -> cb(init_mag)
+
+    Listeners that are bound methods are held by weak reference, and dropped once their owner is
+    collected. Geometry listeners are only called when ``_CoreProperties.version`` has moved on
+    since the previous notification; listeners may read that same counter to skip work they
+    have already done for the current state.
     """
+    __slots__ = (
+        # Touched on every geometry/mesh notification
+        "_props_controller", "_hold_depth", "_geometry_dirty", "_notified_version",
+        "_geometry_listeners", "_mesh_listeners", "_init_mag_listeners",
+        # Only touched on UI events (building, switching workspaces)
+        "workspace_features", "_workspace_names", "workspace_selector", "_debounced_update",
+        "workspace_container",
+        "_built_panels", "_active_workspace", "_has_built_once",
+        "__weakref__",  # keep bound methods usable with WeakMethod, as before slots
+    )
 
     def __init__(
             self,
@@ -61,18 +118,31 @@ class WorkspaceController:
         plot_callback :
             Typically: viewport_area.plot_regions
         """
+        # Hot-path state first; UI-only attributes are assigned further down
         self._props_controller = properties_controller
-        self._plot_callback = plot_callback
 
-        # ——— listener lists for any outside subscriber (e.g. OutlinerController) ———
-        self._geometry_listeners: typing.List[typing.Callable[[df.Region, typing.Dict[str, df.Region]], None]] = []
-        self._mesh_listeners: typing.List[typing.Callable[[df.Mesh], None]] = []
-        self._init_mag_listeners: typing.List[typing.Callable[[df.Field], None]] = []
-
-        self._has_built_once = False
-
-        self.workspace_features = {
-            'Initialisation': InitialisationController(
+        # Nesting depth of `hold()`; geometry notifications are deferred while this is non-zero
+        self._hold_depth = 0
+        self._geometry_dirty = False
+        # `_CoreProperties.version` the geometry listeners were last notified for
+        self._notified_version: Optional[int] = None
+
+        # ——— listener registries for any outside subscriber (e.g. OutlinerController) ———
+        # Tuples: rebuilt on (rare) registration, and cheap to iterate on every notification
+        # Each entry is a `_listener_ref`, which must be called to retrieve the listener itself
+        self._geometry_listeners: tuple[_ListenerRef, ...] = ()
+        self._mesh_listeners: tuple[_ListenerRef, ...] = ()
+        self._init_mag_listeners: tuple[_ListenerRef, ...] = ()
+
+        if plot_callback:
+            # The viewport is simply the first geometry listener. Its redraws are throttled, but the
+            # listeners registered after it stay synchronous so panel state is never stale
+            plot = throttle(_PLOT_THROTTLE_S)(plot_callback)
+            self.register_geometry_listener(lambda main, subs: plot(main, subs, True))
+
+        # (name, controller) pairs in selector order; the selector's `index` picks the entry
+        self.workspace_features: tuple[tuple[str, Any], ...] = (
+            ('Initialisation', InitialisationController(
                 properties_controller=self._props_controller,
                 workspace_controller=self,
                 domain_callback=self._on_domain,
@@ -80,31 +150,96 @@ class WorkspaceController:
                 remove_callback=self._remove_subregion,
                 mesh_callback=self._on_mesh_created,
                 init_mag_callback=self._on_init_mag_created,
-            )
-        }
+            )),
+        )
+        # Fixed for the controller's lifetime, so derived once
+        self._workspace_names: tuple[str, ...] = tuple(name for name, _ in self.workspace_features)
 
         self.workspace_selector = widgets.ToggleButtons(
-            options=list(self.workspace_features),
-            value='Initialisation',
+            options=self._workspace_names,
+            index=0,
             description='Workspace:',
             layout=widgets.Layout(width='auto', overflow='hidden'),
             style={'button_width': '10ch'}
         )
-        self.workspace_selector.observe(self._on_workspace_change, names='value')
+        self._debounced_update = debounce(SELECT_DEBOUNCE_S)(self._update_container)
+        self.workspace_selector.observe(self._on_workspace_change, names='index')
 
-        self.workspace_container: typing.Optional[widgets.Box] = None
+        self.workspace_container: Optional[widgets.Box] = None
+
+        # Slot (a Box owned by us) holding each workspace's root widget, by selector index. Built
+        # on a workspace's first display, then kept mounted in the container and only shown/hidden
+        self._built_panels: list[Optional[widgets.Box]] = [None] * len(self.workspace_features)
+        self._active_workspace: Optional[int] = None
+
+        self._has_built_once = False
 
     def _on_workspace_change(self, change):
-        if change['name'] == 'value':
-            self._update_container()
+        if change['name'] == 'index' and change['new'] != change['old']:
+            self._debounced_update()
 
     def _update_container(self):
-        """Internal API for swapping in the new workspace widget."""
-        ws = self.workspace_features[self.workspace_selector.value]
-        # build the new workspace panel
-        ws_panel = ws.build()
-        # replace the sole child of our container
-        self.workspace_container.children = (ws_panel,)
+        """
+        Internal API for showing the selected workspace.
+
+        Workspaces sit side by side in the container; switching hides the previous slot and shows
+        the selected one via ``layout.display``, so the frontend keeps every mounted view alive.
+        """
+        index = self.workspace_selector.index
+        if index is None:
+            return
+
+        active = self._active_workspace
+        if active is not None and active != index:
+            previous = self._built_panels[active]
+            if previous is not None:
+                previous.layout.display = 'none'
+
+        ws_slot = self._built_panels[index]
+        if ws_slot is None:
+            # build the new workspace panel; only happens on first display or after invalidation.
+            # The slot's Layout is ours to toggle, unlike the (possibly shared) one of the workspace
+            ws_slot = widgets.Box(
+                children=(self.workspace_features[index][1].build(),),
+                layout=widgets.Layout(
+                    display='flex',
+                    flex='1 1 0',
+                    width='100%',
+                    min_height='0',
+                    overflow='hidden'
+                )
+            )
+            self._built_panels[index] = ws_slot
+            self.workspace_container.children += (ws_slot,)
+        elif ws_slot.layout.display != 'flex':
+            ws_slot.layout.display = 'flex'
+
+        self._active_workspace = index
+
+    def invalidate_workspace(self, name: str) -> None:
+        """
+        Discard the cached widget of workspace ``name``, so that it is rebuilt when next shown.
+
+        Only needed after structural changes that the workspace cannot apply to its live widgets.
+        """
+        if name not in self._workspace_names:
+            return
+
+        index = self._workspace_names.index(name)
+        ws_slot = self._built_panels[index]
+        if ws_slot is None:
+            return
+
+        self._built_panels[index] = None
+
+        self.workspace_container.children = tuple(
+            child for child in self.workspace_container.children if child is not ws_slot
+        )
+
+        if index == self._active_workspace:
+            # Nothing is showing now; rebuild straight away rather than on the next selection
+            self._active_workspace = None
+            self._update_container()
 
     def build(self) -> widgets.Box:
         """
@@ -114,7 +249,7 @@ class WorkspaceController:
         """
         if not self._has_built_once:
             # Select initial workspace
-            self.workspace_selector.value = list(self.workspace_features.keys())[0]
+            self.workspace_selector.index = 0
             self._has_built_once = True
 
             # Hosts dynamic content from Workspace area of interface
@@ -128,6 +263,7 @@ class WorkspaceController:
             )
 
         # render the sub‐workspace while updating to its default feature + panel selection
+        self._debounced_update.cancel()
         self._update_container()
 
         return self.workspace_container
@@ -141,88 +277,167 @@ class WorkspaceController:
         return container
 
     # ——— registration API for external listeners ———
-    def register_geometry_listener(self, cb: typing.Callable):
-        self._geometry_listeners.append(cb)
+    def register_geometry_listener(self, cb: Callable):
+        self._geometry_listeners += (_listener_ref(cb),)
+
+    @staticmethod
+    def _notify(listeners: tuple, *args) -> bool:
+        """Call every live listener in ``listeners`` with ``args``; return whether any had died."""
+        found_dead = False
+        for ref in listeners:
+            cb = ref()
+            if cb is None:
+                found_dead = True
+                continue
+
+            cb(*args)
+
+        return found_dead
+
+    @staticmethod
+    def _prune(listeners: tuple) -> tuple:
+        """Drop the listeners whose owners have been collected."""
+        return tuple(ref for ref in listeners if ref() is not None)
 
     # — plot proxy —
-    def _plot_regions(self, main_region: df.Region, subregions: dict[str, df.Region], show_domain: bool = True):
-        """Wired to ViewpointsController.plot_regions"""
-        logger.debug("WorkspaceController._plot_regions: attempting to update Viewports area")
-        if self._plot_callback:
-            self._plot_callback(main_region, subregions, show_domain)
+    def _plot_regions(self, main_region: df.Region, subregions: dict[str, df.Region]):
+        """Redraw the viewport (ViewpointsController.plot_regions) and notify geometry subscribers."""
+        listeners = self._geometry_listeners
+        if not listeners:
+            # Nobody draws or reacts to the geometry (e.g. no viewport attached yet)
+            return
 
-        # notify geometry subscribers too
-        for cb in self._geometry_listeners:
-            cb(main_region, subregions)
+        if self._notify(listeners, main_region, subregions):
+            self._geometry_listeners = self._prune(self._geometry_listeners)
 
-        logger.success("WorkspaceController._plot_regions:")
+        logger.debug("WorkspaceController._plot_regions: updated Viewports area and listeners")
 
     # ---- geometry state mutators  ----
     def _on_domain(self, region):
         logger.debug("WorkspaceController._on_domain: got new domain %r", region)
-        self._props_controller._main_region = region
+        if _same_region(region, self._props_controller.main_region):
+            # Re-submitting the current domain would only redraw and re-notify the same state
+            logger.debug("WorkspaceController._on_domain: domain unchanged; skipping update")
+            return
 
-        try:
-            self._after_geometry_change()
-        except Exception:
-            logger.exception("WorkspaceController._on_domain: Error while redrawing after domain change")
+        props = self._props_controller
+        if region is None:
+            # 'Reset domain': drop the stored domain rather than pushing None through the setter
+            props._remove_region(props._domain_key)
+        elif isinstance(region, df.Region):
+            props._main_region = region
+        else:
+            logger.error("WorkspaceController._on_domain: expected df.Region or None, got %r", type(region))
+            return
 
-        logger.success("WorkspaceController._on_domain: set new domain %r", region)
+        self._after_geometry_change()
+
+        logger.success("WorkspaceController._on_domain: %s domain", "cleared" if region is None else "set new")
 
     def _add_subregion(self, subregion_name: str, region):
         logger.debug("WorkspaceController._add_subregion: got new region [%r] %r",
                      subregion_name, region)
-        self._props_controller._add_region(subregion_name, region)
+        if _same_region(self._props_controller.regions.get(subregion_name), region):
+            logger.debug("WorkspaceController._add_subregion: region [%r] unchanged; skipping update",
+                         subregion_name)
+            return
 
-        try:
-            self._after_geometry_change()
-        except Exception:
-            logger.exception("WorkspaceController._add_subregion: Error while redrawing after adding a region.")
+        if not isinstance(region, df.Region):
+            logger.error("WorkspaceController._add_subregion: expected df.Region for [%r], got %r",
+                         subregion_name, type(region))
+            return
 
-        logger.success("WorkspaceController._add_subregion: added new region [%r] %r", subregion_name, region)
+        self._props_controller._add_region(subregion_name, region)
+        self._after_geometry_change()
+
+        logger.success("WorkspaceController._add_subregion: added new region [%r]", subregion_name)
 
     def _remove_subregion(self, subregion_name: str):
         logger.debug("WorkspaceController._remove_subregion: got removal request for region [%r]",
                      subregion_name)
-        self._props_controller._remove_region(subregion_name)
+        if subregion_name not in self._props_controller.regions:
+            logger.debug("WorkspaceController._remove_subregion: no region [%r]; skipping update",
+                         subregion_name)
+            return
 
-        try:
-            self._after_geometry_change()
-        except Exception:
-            logger.exception("WorkspaceController._remove_subregion: Error while redrawing after removing a region.")
+        self._props_controller._remove_region(subregion_name)
+        self._after_geometry_change()
 
         logger.success("WorkspaceController._remove_subregion: removed region [%r].", subregion_name)
 
+    @contextmanager
+    def hold(self):
+        """
+        Defer geometry redraws and listener notifications until the outermost ``hold`` exits,
+        then fire them once if anything changed.
+
+        Use when applying several geometry changes in a row, e.g. loading saved subregions::
+
+            with workspace_controller.hold():
+                for name, region in saved_regions.items():
+                    workspace_controller._add_subregion(name, region)
+        """
+        self._hold_depth += 1
+        try:
+            yield
+        finally:
+            self._hold_depth -= 1
+            if self._hold_depth == 0 and self._geometry_dirty:
+                self._geometry_dirty = False
+                self._after_geometry_change()
+
     def _after_geometry_change(self):
         """
         Run after main_region or subregions change:
          - redraw the viewport
          - (if you had an outliner workspace, refresh it here)
+
+        Inside ``hold()`` this only marks the geometry as changed. Nothing is sent if the shared
+        properties have not changed since the last notification.
+
+        This is the one place redraw failures are caught, whether reached from a mutator or from
+        the exit of ``hold()``; the stored geometry is already updated by then.
         """
-        self._plot_regions(self._props_controller.main_region, self._props_controller.regions, True)
+        if self._hold_depth:
+            self._geometry_dirty = True
+            return
+
+        version = self._props_controller.version
+        if version == self._notified_version:
+            return
+        self._notified_version = version
+
+        try:
+            self._plot_regions(self._props_controller.main_region, self._props_controller.regions)
+        except Exception:
+            logger.exception("WorkspaceController._after_geometry_change: Error while redrawing after geometry change")
 
     # ---- system‐init state mutators ----
     def _on_mesh_created(self, mesh):
-        logger.success("WorkspaceController got mesh: %r", mesh)
+        # Only the shape; a mesh's repr lists every subregion
+        logger.success("WorkspaceController got mesh: n=%s", mesh.n)
         self._props_controller._main_mesh = mesh
 
         # notify mesh subscribers
-        for cb in self._mesh_listeners:
-            cb(mesh)
+        listeners = self._mesh_listeners
+        if listeners and self._notify(listeners, mesh):
+            self._mesh_listeners = self._prune(self._mesh_listeners)
 
-    def register_mesh_listener(self, cb: typing.Callable):
-        self._mesh_listeners.append(cb)
+    def register_mesh_listener(self, cb: Callable):
+        self._mesh_listeners += (_listener_ref(cb),)
 
     def _on_init_mag_created(self, field):
-        logger.success("WorkspaceController got init‐mag: %r", field)
+        # Never the field's repr, which is as large as the mesh it lives on
+        logger.success("WorkspaceController got init‐mag: nvdim=%s", field.nvdim)
         self._props_controller._set_initial_magnetisation(field)
 
         # notify init‐mag subscribers
-        for cb in self._init_mag_listeners:
-            cb(field)
+        listeners = self._init_mag_listeners
+        if listeners and self._notify(listeners, field):
+            self._init_mag_listeners = self._prune(self._init_mag_listeners)
 
-    def register_init_mag_listener(self, cb: typing.Callable):
-        self._init_mag_listeners.append(cb)
+    def register_init_mag_listener(self, cb: Callable):
+        self._init_mag_listeners += (_listener_ref(cb),)
 
 
 class WorkspaceTopMenu: